@@ -24,6 +24,9 @@ logger = init_logger(__name__)
 
 _GB = 1 << 30
 _EMBEDDING_MODEL_MAX_NUM_BATCHED_TOKENS = 32768
+# Special speculative_model value that selects ngram prompt-lookup drafting
+# instead of a draft model.
+_NGRAM_SPECULATIVE_MODEL = "[ngram]"
 
 
 class ModelConfig:
@@ -875,7 +878,7 @@ class SpeculativeConfig:
         draft_code_revision = None
         draft_quantization = None
 
-        if speculative_model == "[ngram]":
+        if speculative_model == _NGRAM_SPECULATIVE_MODEL:
             if ngram_prompt_lookup_min is None:
                 ngram_prompt_lookup_min = 1
             if ngram_prompt_lookup_max is None or ngram_prompt_lookup_max < 1:
@@ -1046,7 +1049,7 @@ class SpeculativeConfig:
 
     def __repr__(self) -> str:
         if self.ngram_prompt_lookup_max > 0:
-            draft_model = "[ngram]"
+            draft_model = _NGRAM_SPECULATIVE_MODEL
         else:
             draft_model = self.draft_model_config.model
         num_spec_tokens = self.num_speculative_tokens
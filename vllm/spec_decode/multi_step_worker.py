@@ -142,9 +142,9 @@ class MultiStepWorker(Worker, ProposerWorkerBase):
             # We must shallow-copy seq_data as we will append token ids
             new_seq_data: Dict[int, SequenceData] = {}
             for seq_id, old_seq_data in seq_group_metadata.seq_data.items():
-                new_seq_data[seq_id] = copy.copy(old_seq_data)
-                new_seq_data[
-                    seq_id].output_token_ids = old_seq_data.output_token_ids[:]
+                seq_data = copy.copy(old_seq_data)
+                seq_data.output_token_ids = old_seq_data.output_token_ids[:]
+                new_seq_data[seq_id] = seq_data
 
             seq_group_metadata.seq_data = new_seq_data
 
@@ -159,8 +159,8 @@ class MultiStepWorker(Worker, ProposerWorkerBase):
         assert self.model_runner.block_size is not None
         for seq_group_metadata in seq_group_metadata_list:
             # Only one seq_id is guaranteed because there is no beam search.
-            seq_id = list(seq_group_metadata.seq_data.keys())[0]
-            seq = seq_group_metadata.seq_data[seq_id]
+            # Avoid materializing a list of keys per sequence per step.
+            seq_id, seq = next(iter(seq_group_metadata.seq_data.items()))
 
             # After num_steps, the seq len will be the current seq len
             # plus one token per step.
@@ -60,6 +60,9 @@ class NGramWorker(NonLLMProposerWorkerBase, LoraNotSupportedWorkerBase):
         has_spec_out = False
         token_id_list: List[Optional[torch.Tensor]] = []
         token_prob_list: List[Optional[torch.Tensor]] = []
+        # Offsets of the proposal tokens from the match position. These are
+        # the same for every sequence, so allocate them once per call.
+        spec_offsets = torch.arange(sample_len, device=self.device)
         for idx, seq_group_metadata in enumerate(
                 execute_model_req.seq_group_metadata_list):
             seq_data = next(iter(seq_group_metadata.seq_data.values()))
@@ -95,8 +98,7 @@ class NGramWorker(NonLLMProposerWorkerBase, LoraNotSupportedWorkerBase):
                 if first_match.values.item():
                     proposal_start_idx = first_match.indices.add_(ngram_size)
                     spec_indices = (
-                        proposal_start_idx).repeat(sample_len) + torch.arange(
-                            sample_len, device=self.device)
+                        proposal_start_idx).repeat(sample_len) + spec_offsets
                     spec_indices.clamp_(max=input_ids.shape[-1] - 1)
                     res = input_ids.gather(dim=-1, index=spec_indices)
                     token_id_list.append(res)
@@ -113,6 +115,11 @@ class NGramWorker(NonLLMProposerWorkerBase, LoraNotSupportedWorkerBase):
         if not has_spec_out:
             return None, False
 
+        # The logprobs are placeholders and are only read (stacked) later, so
+        # a single zero tensor can be shared by all outputs.
+        logprobs = torch.zeros((sample_len, self.vocab_size),
+                               dtype=torch.float32,
+                               device=self.device)
         outputs: List[Optional[SamplerOutput]] = []
         for idx in range(len(execute_model_req.seq_group_metadata_list)):
             if token_id_list[idx] is None:
@@ -122,9 +129,7 @@ class NGramWorker(NonLLMProposerWorkerBase, LoraNotSupportedWorkerBase):
                     SamplerOutput(
                         outputs=None,
                         sampled_token_probs=token_prob_list[idx],
-                        logprobs=torch.zeros((sample_len, self.vocab_size),
-                                             dtype=torch.float32,
-                                             device=self.device),
+                        logprobs=logprobs,
                         sampled_token_ids=token_id_list[idx],
                     ))
 
@@ -429,22 +429,34 @@ class SpecDecodeWorker(LoraNotSupportedWorkerBase):
             seq_group_metadata_list,
             proposal_lens_list,
             select_proposal_len_zero=True)
-        original_indices = spec_indices + non_spec_indices
+
+        # Move the index lists to the device once; indexing with a Python list
+        # would otherwise build and copy a new index tensor on every use.
+        device = proposal_scores.token_ids.device
+        spec_indices_tensor = torch.tensor(spec_indices,
+                                           dtype=torch.long,
+                                           device=device)
+        non_spec_indices_tensor = torch.tensor(non_spec_indices,
+                                               dtype=torch.long,
+                                               device=device)
+        original_indices_tensor = torch.cat(
+            [spec_indices_tensor, non_spec_indices_tensor])
 
         # Get probabilities of target model, excluding bonus token.
-        proposal_verifier_probs = proposal_scores.probs[spec_indices, :-1]
+        proposal_verifier_probs = proposal_scores.probs[
+            spec_indices_tensor, :-1]
 
         # Get non-speculative sampled tokens from target model.
-        non_spec_token_ids = proposal_scores.token_ids[non_spec_indices]
+        non_spec_token_ids = proposal_scores.token_ids[non_spec_indices_tensor]
 
         # Get bonus tokens from target model.
-        bonus_token_ids = proposal_scores.token_ids[spec_indices, -1:]
+        bonus_token_ids = proposal_scores.token_ids[spec_indices_tensor, -1:]
 
         # Get probabilities according to proposal method.
-        proposal_probs = proposals.proposal_probs[spec_indices]
+        proposal_probs = proposals.proposal_probs[spec_indices_tensor]
 
         # Get proposed tokens.
-        proposal_token_ids = proposals.proposal_token_ids[spec_indices]
+        proposal_token_ids = proposals.proposal_token_ids[spec_indices_tensor]
 
         accepted_token_ids = self.rejection_sampler(
             target_probs=proposal_verifier_probs,
@@ -464,7 +476,8 @@ class SpecDecodeWorker(LoraNotSupportedWorkerBase):
 
         # Rearrange so that results are in the order of the original seq group
         # metadata.
-        accepted_token_ids[original_indices] = accepted_token_ids.clone()
+        accepted_token_ids[original_indices_tensor] = (
+            accepted_token_ids.clone())
 
         return accepted_token_ids, logprobs
 
@@ -518,10 +531,17 @@ class SpecDecodeWorker(LoraNotSupportedWorkerBase):
         # Construct the output on a per-step, per-sequence basis.
         sampler_output_list: List[SamplerOutput] = []
         for step_index in range(num_steps):
-            if all(token_id == -1
-                   for token_id in accepted_token_ids_by_step[step_index]):
+            # Resolve the per-step rows once rather than per sequence.
+            step_token_ids = accepted_token_ids_by_step[step_index]
+            if all(token_id == -1 for token_id in step_token_ids):
                 break
 
+            step_token_id_ranks = accepted_token_id_ranks_by_step[step_index]
+            step_token_id_logprobs = accepted_token_id_logprobs_by_step[
+                step_index]
+            step_topk_indices = topk_indices_by_step[step_index]
+            step_topk_logprobs = topk_logprobs_by_step[step_index]
+
             step_output_token_ids: List[CompletionSequenceGroupOutput] = []
             for sequence_index in range(batch_size):
                 # Each sequence may have a different num_logprobs; retrieve it.
@@ -529,17 +549,16 @@ class SpecDecodeWorker(LoraNotSupportedWorkerBase):
 
                 step_output_token_ids.append(
                     create_sequence_group_output(
-                        token_id=accepted_token_ids_by_step[step_index]
-                        [sequence_index],
-                        token_id_logprob_rank=accepted_token_id_ranks_by_step[
-                            step_index][sequence_index],
-                        token_id_logprob=accepted_token_id_logprobs_by_step[
-                            step_index][sequence_index],
+                        token_id=step_token_ids[sequence_index],
+                        token_id_logprob_rank=step_token_id_ranks[
+                            sequence_index],
+                        token_id_logprob=step_token_id_logprobs[
+                            sequence_index],
                         seq_id=seq_ids[sequence_index],
-                        topk_token_ids=topk_indices_by_step[step_index]
-                        [sequence_index][:num_logprobs],
-                        topk_logprobs=topk_logprobs_by_step[step_index]
-                        [sequence_index][:num_logprobs],
+                        topk_token_ids=step_topk_indices[sequence_index]
+                        [:num_logprobs],
+                        topk_logprobs=step_topk_logprobs[sequence_index]
+                        [:num_logprobs],
                     ))
 
             sampler_output_list.append(
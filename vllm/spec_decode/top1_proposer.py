@@ -39,6 +39,11 @@ class Top1Proposer(SpeculativeProposer):
         self.max_proposal_len = max_proposal_len
         self._vocab_size = vocab_size
 
+        # Lazily-allocated fill values (token id, prob, proposal len) used to
+        # build empty proposals when no sequence is speculated.
+        self._empty_proposal_fill: Optional[Tuple[torch.Tensor, torch.Tensor,
+                                                  torch.Tensor]] = None
+
     def get_spec_proposals(
         self,
         execute_model_req: ExecuteModelRequest,
@@ -149,8 +154,12 @@ class Top1Proposer(SpeculativeProposer):
         )
 
     @staticmethod
-    def _remove_no_proposal_seqs(proposal_lens, maybe_sampler_output,
-                                 nonzero_proposal_len_indices, transposed):
+    def _remove_no_proposal_seqs(
+        proposal_lens: List[int],
+        maybe_sampler_output: Optional[List[SamplerOutput]],
+        nonzero_proposal_len_indices: List[int],
+        transposed: bool,
+    ) -> Tuple[List[int], Optional[List[SamplerOutput]], List[int]]:
         """Remove sequences from nonzero_proposal_len_indices and reset
         their proposal_len to 0 the draft worker does not provide a proposal
         (maybe_sampler_output=None). This can avoid scoring overheads.
@@ -165,6 +174,12 @@ class Top1Proposer(SpeculativeProposer):
             return (proposal_lens, maybe_sampler_output,
                     nonzero_proposal_len_indices)
 
+        # If the draft worker provided a proposal for every sequence it was
+        # given, there is nothing to remove; skip the rebuild below.
+        if all(output is not None for output in maybe_sampler_output):
+            return (proposal_lens, maybe_sampler_output,
+                    nonzero_proposal_len_indices)
+
         new_proposal_lens: List[int] = []
         new_nonzero_proposal_len_indices: List[int] = []
         new_maybe_sampler_output: List[SamplerOutput] = []
@@ -212,45 +227,62 @@ class Top1Proposer(SpeculativeProposer):
         proposal_lens: List[int],
         nonzero_proposal_len_indices: List[int],
         sampler_transposed: bool,
-    ) -> Tuple[torch.Tensor, torch.tensor, torch.Tensor]:
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """After speculations are produced, merge the speculation results with
         the skipped sequences.
         """
         if maybe_sampler_output is None:
             # If no speculative tokens, the sampler output will be None.
-            # In this case we return empty proposals.
-            proposal_tokens = torch.tensor(-1,
-                                           dtype=torch.long,
-                                           device=self._device).expand(
-                                               batch_size, proposal_len)
-            proposal_probs = torch.tensor(0,
-                                          dtype=torch.float32,
-                                          device=self._device).expand(
-                                              batch_size, proposal_len,
+            # In this case we return empty proposals. The fill values are
+            # allocated once and reused, as the outputs are expanded views.
+            if self._empty_proposal_fill is None:
+                self._empty_proposal_fill = (
+                    torch.tensor(-1, dtype=torch.long, device=self._device),
+                    torch.tensor(0, dtype=torch.float32, device=self._device),
+                    torch.tensor(0, dtype=torch.long, device=self._device),
+                )
+            token_fill, prob_fill, len_fill = self._empty_proposal_fill
+            proposal_tokens = token_fill.expand(batch_size, proposal_len)
+            proposal_probs = prob_fill.expand(batch_size, proposal_len,
                                               self._vocab_size)
-            proposal_lens_tensor = torch.tensor(0,
-                                                dtype=torch.long,
-                                                device=self._device).expand(
-                                                    len(proposal_lens))
+            proposal_lens_tensor = len_fill.expand(len(proposal_lens))
             return proposal_tokens, proposal_probs, proposal_lens_tensor
 
         sampler_output = maybe_sampler_output
         proposal_tokens, proposal_probs, _ = sampler_output_to_torch(
             sampler_output, sampler_transposed)
 
+        if len(nonzero_proposal_len_indices) == batch_size:
+            # Fast path: every sequence has a proposal, so the sampler output
+            # is already in batch order and no padding/scatter is needed.
+            proposal_lens_tensor = torch.full((batch_size, ),
+                                              proposal_len,
+                                              dtype=torch.long,
+                                              device=self._device)
+            return proposal_tokens, proposal_probs, proposal_lens_tensor
+
         # Now, reformat the output GPU tensors such that each sequence has
         # a proposal. the proposal can be empty, e.g. [-1, -1, -1]
 
+        # Build the index tensor once and reuse it for every scatter, instead
+        # of converting the Python index list on each indexed assignment.
+        nonzero_proposal_len_indices_tensor = torch.as_tensor(
+            nonzero_proposal_len_indices,
+            dtype=torch.long,
+            device=self._device)
+
         entire_proposal_tokens = proposal_tokens.new_full(
             size=(batch_size, *proposal_tokens.shape[1:]),
             fill_value=-1,
         )
-        entire_proposal_tokens[nonzero_proposal_len_indices] = proposal_tokens
+        entire_proposal_tokens.index_copy_(
+            0, nonzero_proposal_len_indices_tensor, proposal_tokens)
         entire_proposal_probs = proposal_probs.new_zeros(
             batch_size,
             *proposal_probs.shape[1:],
         )
-        entire_proposal_probs[nonzero_proposal_len_indices] = proposal_probs
+        entire_proposal_probs.index_copy_(
+            0, nonzero_proposal_len_indices_tensor, proposal_probs)
 
         proposal_tokens, proposal_probs = (
             entire_proposal_tokens,
@@ -260,6 +292,7 @@ class Top1Proposer(SpeculativeProposer):
         proposal_lens_tensor = torch.zeros(batch_size,
                                            dtype=torch.long,
                                            device=self._device)
-        proposal_lens_tensor[nonzero_proposal_len_indices] = proposal_len
+        proposal_lens_tensor.index_fill_(0, nonzero_proposal_len_indices_tensor,
+                                         proposal_len)
 
         return proposal_tokens, proposal_probs, proposal_lens_tensor
@@ -110,20 +110,15 @@ def split_batch_by_proposal_len(
     lens in a batch.
     """
 
-    if select_proposal_len_zero:
-        predicate = lambda proposal_len: proposal_len == 0
-    else:
-        predicate = lambda proposal_len: proposal_len != 0
-
-    indices = [
-        i for i, (_, proposal_len
-                  ) in enumerate(zip(seq_group_metadata_list, proposal_lens))
-        if predicate(proposal_len)
-    ]
-    seq_groups = [
-        seq_group for seq_group, proposal_len in zip(
-            seq_group_metadata_list, proposal_lens) if predicate(proposal_len)
-    ]
+    seq_groups: List[SequenceGroupMetadata] = []
+    indices: List[int] = []
+    # Single pass over the batch; compare directly rather than calling a
+    # predicate per sequence.
+    for i, (seq_group, proposal_len) in enumerate(
+            zip(seq_group_metadata_list, proposal_lens)):
+        if (proposal_len == 0) == select_proposal_len_zero:
+            seq_groups.append(seq_group)
+            indices.append(i)
 
     return seq_groups, indices
 
@@ -179,32 +174,6 @@ def sampler_output_to_torch(
     return sampled_token_ids, sampled_token_probs, sampled_token_logprobs
 
 
-def maybe_mock_device_tensors(sampler_output: SamplerOutput, batch_size: int,
-                              vocab_size: int, device: str) -> None:
-    """Helper method which mocks out the GPU tensors in SamplerOutput with dummy
-    values. This will be removed in PR 7/9.
-    https://docs.google.com/document/d/1rE4pr3IdspRw97XbImY4fS9IWYuJJ3HGtL7AdIKGrw8/edit#heading=h.qijw1sdidrer
-    """
-    values = [
-        sampler_output.sampled_token_probs, sampler_output.sampled_token_ids
-    ]
-    assert all(v is None for v in values) or not any(v is None for v in values)
-    if not any(v is None for v in values):
-        # Do nothing if the tensors are already created (usually in unit tests).
-        return
-
-    # Softmax to ensure valid probs.
-    sampler_output.sampled_token_probs = torch.nn.functional.softmax(
-        torch.rand(batch_size, vocab_size, dtype=torch.float32, device=device),
-        dim=-1)
-
-    sampler_output.sampled_token_ids = torch.randint(low=10,
-                                                     high=100,
-                                                     size=(batch_size, ),
-                                                     dtype=torch.long,
-                                                     device=device)
-
-
 @contextmanager
 def nvtx_range(msg, *args, **kwargs):
     """ 